@@ -5,10 +5,31 @@ Mem0 auto-extracts memories from conversations.
 """
 
 import os
+import functools
 from mem0 import Memory
 
-# Initialize
-m = Memory()
+
+@functools.lru_cache(maxsize=1)
+def get_memory() -> Memory:
+    """The single Mem0 instance behind `m`, so the embedder loads once."""
+    return Memory()
+
+
+class _Lazy:
+    """Defers building an object until one of its attributes is used."""
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+    
+    def __getattr__(self, name):
+        if self._value is None:
+            self._value = self._factory()
+        return getattr(self._value, name)
+
+
+# Initialize (on first use, so importing this module stays cheap)
+m = _Lazy(get_memory)
 
 # Store memories from a conversation
 def remember_conversation(user_id: str, messages: list[dict]):
@@ -4,6 +4,10 @@ ChromaDB Local Vector Store for OpenClaw Agents
 Zero config, runs in-process, fast semantic search.
 """
 
+import os
+import uuid
+import functools
+
 import chromadb
 from chromadb.config import Settings
 
@@ -12,29 +16,50 @@ def get_ephemeral_client():
     return chromadb.Client()
 
 # Persistent (survives restarts)
+# One client per directory, so every store in the process shares its sqlite connection
 def get_persistent_client(path: str = "./chroma_db"):
+    return _get_client(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(path: str):
     return chromadb.PersistentClient(path=path)
 
 
+def _hnsw_params(expected: int) -> dict:
+    """
+    Cosine HNSW settings for MemoryStore, scaled to the expected memory count.
+    Chroma only applies these when the collection is first created; an
+    existing collection keeps the settings it was created with.
+    """
+    m, ef_construction, ef_search = (
+        (16, 64, 40) if expected < 100_000 else
+        (24, 100, 100) if expected < 1_000_000 else
+        (32, 128, 200)
+    )
+    return {"hnsw:space": "cosine", "hnsw:M": m,
+            "hnsw:construction_ef": ef_construction, "hnsw:search_ef": ef_search}
+
+
 class MemoryStore:
     """Simple wrapper for agent memory using ChromaDB."""
     
-    def __init__(self, persist_path: str = None):
+    def __init__(self, persist_path: str = None, expected_size: int = 10_000):
         if persist_path:
-            self.client = chromadb.PersistentClient(path=persist_path)
+            self.client = get_persistent_client(persist_path)
         else:
             self.client = chromadb.Client()
         
         # Create or get the memories collection
         self.collection = self.client.get_or_create_collection(
             name="agent_memories",
-            metadata={"hnsw:space": "cosine"}  # Use cosine similarity
+            metadata=_hnsw_params(expected_size)  # Cosine similarity, tuned HNSW
         )
     
     def add(self, text: str, metadata: dict = None, doc_id: str = None):
         """Add a memory."""
         if doc_id is None:
-            doc_id = f"mem_{self.collection.count()}"
+            doc_id = uuid.uuid4().hex
         
         self.collection.add(
             documents=[text],
@@ -43,6 +68,20 @@ class MemoryStore:
         )
         return doc_id
     
+    def add_many(self, texts: list[str], metadatas: list[dict] = None, doc_ids: list[str] = None):
+        """Add several memories in a single batched call."""
+        if not texts:
+            return []
+        if doc_ids is None:
+            doc_ids = [uuid.uuid4().hex for _ in texts]
+        
+        self.collection.add(
+            documents=texts,
+            metadatas=metadatas,  # Chroma rejects empty dicts, so pass None through
+            ids=doc_ids
+        )
+        return doc_ids
+    
     def search(self, query: str, n_results: int = 5):
         """Search memories by semantic similarity."""
         results = self.collection.query(
@@ -51,9 +90,13 @@ class MemoryStore:
         )
         return results
     
-    def get_all(self):
-        """Get all memories."""
-        return self.collection.get()
+    def get_all(self, limit: int = None, where: dict = None):
+        """Get all memories (or the first `limit` matching `where`)."""
+        return self.collection.get(
+            where=where,
+            limit=limit,
+            include=["documents", "metadatas"]
+        )
     
     def delete(self, doc_id: str):
         """Delete a memory by ID."""
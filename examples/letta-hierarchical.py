@@ -78,30 +78,31 @@ class LettaMemory:
 
 # Example usage
 if __name__ == "__main__":
-    print("📚 Letta Hierarchical Memory Example")
-    print("-" * 40)
-    print()
-    print("Letta runs as a server with a web UI.")
-    print()
-    print("To get started:")
-    print("  1. Run: letta server")
-    print("  2. Open: http://localhost:8283")
-    print("  3. Create an agent in the UI")
-    print("  4. Chat and watch it manage its own memory!")
-    print()
-    print("Or use the API:")
-    print()
-    print("```python")
-    print("from letta import create_client")
-    print()
-    print("client = create_client()")
-    print("agent = client.create_agent(name='owl-agent')")
-    print("response = client.send_message(")
-    print("    agent_id=agent.id,")
-    print("    message='Remember that I prefer dark mode',")
-    print("    role='user'")
-    print(")")
-    print("```")
-    print()
-    print("The agent will decide if this goes in core memory, recall, or archival.")
-    print("That's the magic - it self-manages. 🦉")
+    print(f"""\
+📚 Letta Hierarchical Memory Example
+{"-" * 40}
+
+Letta runs as a server with a web UI.
+
+To get started:
+  1. Run: letta server
+  2. Open: http://localhost:8283
+  3. Create an agent in the UI
+  4. Chat and watch it manage its own memory!
+
+Or use the API:
+
+```python
+from letta import create_client
+
+client = create_client()
+agent = client.create_agent(name='owl-agent')
+response = client.send_message(
+    agent_id=agent.id,
+    message='Remember that I prefer dark mode',
+    role='user'
+)
+```
+
+The agent will decide if this goes in core memory, recall, or archival.
+That's the magic - it self-manages. 🦉""")
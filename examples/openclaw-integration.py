@@ -5,15 +5,87 @@ Combining multiple memory systems for a complete agent memory solution.
 """
 
 import os
+import re
+import json
+import uuid
+import hashlib
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 # Import the memory systems
 from mem0 import Memory
 import chromadb
+from chromadb.utils import embedding_functions
+
+
+def _hnsw_params(expected: int, filtered: bool) -> dict:
+    """
+    Cosine HNSW settings for the agent_memories collection. recall() filters
+    by user_id, so `filtered` raises search_ef to at least 100. Only applied
+    when the collection is created; existing collections keep their settings.
+    """
+    m, ef_construction, ef_search = (
+        (16, 64, 40) if expected < 100_000 else
+        (24, 100, 100) if expected < 1_000_000 else
+        (32, 128, 200)
+    )
+    if filtered:
+        ef_search = max(ef_search, 100)
+    return {"hnsw:space": "cosine", "hnsw:M": m,
+            "hnsw:construction_ef": ef_construction, "hnsw:search_ef": ef_search}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(path: str):
+    """One ChromaDB client per directory, shared across the process."""
+    return chromadb.PersistentClient(path=path)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_embedder():
+    """One local embedding model (all-MiniLM-L6-v2) shared by the process."""
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
+def _content_id(text: str) -> str:
+    """Stable ID for a piece of text, so re-ingesting it is idempotent."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_memory(config_json: Optional[str]) -> Memory:
+    return Memory.from_config(json.loads(config_json)) if config_json else Memory()
 
 
-@dataclass
+def get_memory(config: dict = None) -> Memory:
+    """Mem0 instance shared by every OpenClawMemory built with the same mem0_config."""
+    return _shared_memory(json.dumps(config, sort_keys=True) if config else None)
+
+
+def _normalize_meta(meta: dict, user_id: str, source: str) -> dict:
+    """
+    Give every stored row the same metadata keys (user_id, source, type,
+    topic), so `where` filters on those keys can match every row.
+    Chroma rejects None values, so missing keys are stored as "".
+    """
+    meta = meta or {}
+    normalized = {
+        "user_id": user_id,
+        "source": source,
+        "type": meta.get("type") or "",
+        "topic": meta.get("topic") or "",
+    }
+    for key, value in meta.items():
+        normalized.setdefault(key, value)
+    return normalized
+
+
+@dataclass(frozen=True, slots=True)
 class MemoryResult:
     """Unified memory result format."""
     content: str
@@ -35,20 +107,51 @@ class OpenClawMemory:
     This example uses ChromaDB + Mem0 as the core stack (zero infrastructure).
     """
     
-    def __init__(self, persist_path: str = "./agent_memory"):
+    def __init__(self, persist_path: str = "./agent_memory", expected_size: int = 10_000,
+                 mem0_config: dict = None, filtered_search: bool = True,
+                 emb_cache_size: int = 10_000):
         # ChromaDB for fast local search
-        self.chroma = chromadb.PersistentClient(path=persist_path)
+        self.chroma = _get_client(os.path.abspath(persist_path))
+        # HNSW settings only take effect when this creates the collection
         self.collection = self.chroma.get_or_create_collection(
             name="agent_memories",
-            metadata={"hnsw:space": "cosine"}
+            metadata=_hnsw_params(expected_size, filtered=filtered_search),
+            embedding_function=_shared_embedder()
         )
         
         # Mem0 for automatic memory extraction
-        self.mem0 = Memory()
+        self.mem0 = get_memory(mem0_config)
+        
+        # Runs the ChromaDB and Mem0 lookups in recall() side by side
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        
+        # content_id -> float16 embedding, so replayed messages are not re-embedded.
+        # Least recently used entries are evicted past emb_cache_size.
+        self._emb_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._emb_cache_size = emb_cache_size
         
         # User tracking
         self.current_user: Optional[str] = None
     
+    def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, reusing cached vectors for content seen before."""
+        keys = [_content_id(t) for t in texts]
+        found = {}
+        missing = {}
+        for k, t in zip(keys, texts):
+            if k in self._emb_cache:
+                self._emb_cache.move_to_end(k)
+                found[k] = self._emb_cache[k]
+            else:
+                missing[k] = t
+        if missing:
+            vectors = np.asarray(_shared_embedder()(list(missing.values())), dtype=np.float16)
+            for k, vec in zip(missing, vectors):
+                found[k] = self._emb_cache[k] = vec
+            while len(self._emb_cache) > self._emb_cache_size:
+                self._emb_cache.popitem(last=False)
+        return np.stack([found[k] for k in keys]).tolist()
+    
     def set_user(self, user_id: str):
         """Set the current user context."""
         self.current_user = user_id
@@ -63,16 +166,22 @@ class OpenClawMemory:
         # Mem0 auto-extracts memories
         result = self.mem0.add(messages, user_id=user_id)
         
-        # Also store in ChromaDB for fast local search
-        for i, msg in enumerate(messages):
-            self.collection.add(
-                documents=[msg["content"]],
-                metadatas=[{
-                    "role": msg["role"],
-                    "user_id": user_id,
-                    "source": "conversation"
-                }],
-                ids=[f"{user_id}_{self.collection.count()}_{i}"]
+        # Also store in ChromaDB for fast local search (one batched upsert).
+        # IDs are content hashes, so replaying a conversation is a no-op.
+        rows = {
+            f"{user_id}_{_content_id(msg['content'])}": msg
+            for msg in messages
+        }
+        if rows:
+            docs = [msg["content"] for msg in rows.values()]
+            self.collection.upsert(
+                ids=list(rows),
+                documents=docs,
+                embeddings=self._embed(docs),
+                metadatas=[
+                    _normalize_meta({"role": msg["role"]}, user_id, "conversation")
+                    for msg in rows.values()
+                ]
             )
         
         return result
@@ -83,9 +192,9 @@ class OpenClawMemory:
         """
         user_id = user_id or self.current_user or "default"
         metadata = metadata or {}
-        metadata["user_id"] = user_id
+        metadata = _normalize_meta(metadata, user_id, metadata.get("source", "manual"))
         
-        doc_id = f"{user_id}_{self.collection.count()}"
+        doc_id = f"{user_id}_{uuid.uuid4().hex}"
         
         self.collection.add(
             documents=[content],
@@ -95,37 +204,52 @@ class OpenClawMemory:
         
         return doc_id
     
-    def recall(self, query: str, n_results: int = 5, user_id: str = None) -> list[MemoryResult]:
+    def recall(self, query: str, n_results: int = 5, user_id: str = None,
+               filters: list[tuple[str, "re.Pattern | str"]] = None) -> list[MemoryResult]:
         """
         Search memories.
         Queries both ChromaDB (fast, local) and Mem0 (semantic extraction).
+        
+        filters: optional [(metadata_key, regex), ...]; a result is kept only
+        if every pattern matches its metadata value. Patterns are compiled
+        once per call, not per result.
         """
         user_id = user_id or self.current_user
         results = []
+        compiled = [(key, re.compile(pattern)) for key, pattern in filters or ()]
+        
+        def keep(meta: dict) -> bool:
+            return all(p.search(str(meta.get(key, ""))) for key, p in compiled)
         
-        # ChromaDB search
+        # ChromaDB and Mem0 are independent, so query them concurrently
         where_filter = {"user_id": user_id} if user_id else None
-        chroma_results = self.collection.query(
+        f_chroma = self._pool.submit(
+            self.collection.query,
             query_texts=[query],
             n_results=n_results,
             where=where_filter
         )
+        f_mem0 = self._pool.submit(self.mem0.search, query, user_id=user_id, limit=n_results)
         
-        for i, doc in enumerate(chroma_results["documents"][0]):
-            results.append(MemoryResult(
-                content=doc,
-                source="chroma",
-                metadata=chroma_results["metadatas"][0][i],
-                score=chroma_results["distances"][0][i] if "distances" in chroma_results else None
-            ))
+        chroma_results = f_chroma.result()
+        docs = chroma_results["documents"][0]
+        metas = chroma_results["metadatas"][0]
+        dists = (chroma_results.get("distances") or [[None] * len(docs)])[0]
+        results.extend(
+            MemoryResult(content=doc, source="chroma", metadata=meta, score=dist)
+            for doc, meta, dist in zip(docs, metas, dists)
+            if keep(meta)
+        )
         
-        # Mem0 search
-        mem0_results = self.mem0.search(query, user_id=user_id, limit=n_results)
+        mem0_results = f_mem0.result()
         for mem in mem0_results.get("results", []):
+            metadata = mem.get("metadata") or {}
+            if not keep(metadata):
+                continue
             results.append(MemoryResult(
                 content=mem.get("memory", str(mem)),
                 source="mem0",
-                metadata=mem.get("metadata", {})
+                metadata=metadata
             ))
         
         return results
@@ -136,16 +260,15 @@ class OpenClawMemory:
         """
         user_id = user_id or self.current_user or "default"
         
-        # Get all memories for user
-        all_mems = self.mem0.get_all(user_id=user_id)
+        # Only fetch as many memories as the context will hold
+        all_mems = self.mem0.get_all(user_id=user_id, limit=max_memories)
         
         if not all_mems.get("results"):
             return "No stored memories for this user."
         
         context_parts = ["## Relevant Memories"]
         for mem in all_mems["results"][:max_memories]:
-            content = mem.get("memory", str(mem))
-            context_parts.append(f"- {content}")
+            context_parts.append(f"- {mem.get('memory', '')}")
         
         return "\n".join(context_parts)
 
@@ -4,6 +4,7 @@ Zep Temporal Memory for OpenClaw Agents
 Time-aware memory that understands "before" and "after".
 """
 
+import asyncio
 import os
 from zep_python import ZepClient
 from zep_python.memory import Memory, Message
@@ -44,18 +45,70 @@ class TemporalMemory:
         
         messages format: [{"role": "user", "content": "..."}, ...]
         """
+        await self.add_messages_many(session_id, [messages])
+    
+    async def add_messages_many(self, session_id: str, chunks: list[list[dict]]):
+        """
+        Add several groups of messages to a session in one request.
+        
+        Coalescing the groups into a single Memory pays the HTTP round-trip
+        and Zep's synthesis pass once instead of once per group.
+        """
         zep_messages = [
             Message(
                 role=m["role"],
                 content=m["content"],
                 role_type="user" if m["role"] == "user" else "assistant"
             )
+            for messages in chunks
             for m in messages
         ]
+        if not zep_messages:
+            return
         
         memory = Memory(messages=zep_messages)
         await self.client.memory.add(session_id, memory)
     
+    async def add_messages_to_sessions(self, batches: dict[str, list[list[dict]]],
+                                       max_concurrency: int = 16):
+        """
+        Populate several sessions concurrently, one batched request each.
+        
+        batches format: {session_id: [[message, ...], ...], ...}
+        Concurrency is capped to stay under Zep's rate limits.
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+        
+        async def send(session_id: str, chunks: list[list[dict]]):
+            async with limit:
+                await self.add_messages_many(session_id, chunks)
+        
+        await asyncio.gather(*(
+            send(session_id, chunks)
+            for session_id, chunks in batches.items()
+        ))
+    
+    async def _ingest(self, session_id: str, user_id: str, messages: list[dict],
+                      limit: asyncio.Semaphore):
+        """Create one session and load its messages."""
+        async with limit:
+            await self.add_session(session_id, user_id)
+            await self.add_messages(session_id, messages)
+    
+    async def backfill(self, sessions: list[tuple[str, str, list[dict]]],
+                       max_concurrency: int = 16):
+        """
+        Create and populate many sessions concurrently.
+        
+        sessions format: [(session_id, user_id, messages), ...]
+        Concurrency is capped to stay under Zep's rate limits.
+        """
+        limit = asyncio.Semaphore(max_concurrency)
+        await asyncio.gather(*(
+            self._ingest(session_id, user_id, messages, limit)
+            for session_id, user_id, messages in sessions
+        ))
+    
     async def search(self, session_id: str, query: str, limit: int = 5):
         """
         Search memory with temporal awareness.
@@ -75,8 +128,6 @@ class TemporalMemory:
 
 # Example usage (async)
 if __name__ == "__main__":
-    import asyncio
-    
     async def main():
         print("⏱️ Zep Temporal Memory Example")
         print("-" * 40)
@@ -92,17 +143,15 @@ if __name__ == "__main__":
         session_id = "night-crew-session-1"
         user_id = "jack"
         
-        # Create session
-        print(f"Creating session: {session_id}")
-        await tm.add_session(session_id, user_id)
-        
-        # Add conversation
         messages = [
             {"role": "user", "content": "I'm starting a new project today"},
             {"role": "assistant", "content": "Exciting! What's the project?"},
             {"role": "user", "content": "It's called owl-brain, a memory stack for AI agents"},
         ]
-        await tm.add_messages(session_id, messages)
+        
+        # Create session and add conversation
+        print(f"Creating session: {session_id}")
+        await tm.backfill([(session_id, user_id, messages)])
         print("Added messages to session")
         
         # Search with temporal query
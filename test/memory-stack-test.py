@@ -6,6 +6,18 @@ Run: source .venv/bin/activate && python test/memory-stack-test.py
 
 import os
 import sys
+import functools
+
+
+@functools.cache
+def _load_openai_key(path: str = "~/.config/openai/api_key"):
+    """Read the OpenAI key file once per process."""
+    key_path = os.path.expanduser(path)
+    if os.path.exists(key_path):
+        with open(key_path) as f:
+            return f.read().strip()
+    return None
+
 
 def test_chromadb():
     """Test ChromaDB - Local vector database"""
@@ -14,7 +26,7 @@ def test_chromadb():
     
     # Create ephemeral client (in-memory)
     client = chromadb.Client()
-    collection = client.create_collection("test_collection")
+    collection = client.get_or_create_collection("test_collection")
     
     # Add some test data
     collection.add(
@@ -37,13 +49,9 @@ def test_mem0():
     try:
         from mem0 import Memory
         
-        # Check for OpenAI key
+        # Check for OpenAI key, falling back to the config file
         if not os.environ.get("OPENAI_API_KEY"):
-            # Try loading from config
-            key_path = os.path.expanduser("~/.config/openai/api_key")
-            if os.path.exists(key_path):
-                with open(key_path) as f:
-                    os.environ["OPENAI_API_KEY"] = f.read().strip()
+            os.environ["OPENAI_API_KEY"] = _load_openai_key() or ""
         
         if not os.environ.get("OPENAI_API_KEY"):
             print("  ⚠️ Mem0 requires OPENAI_API_KEY - skipping live test")
@@ -103,11 +111,12 @@ def main():
         emoji = "✅" if status else "⚠️"
         print(f"  {emoji} {name}")
     
-    print("\n💡 Next steps:")
-    print("  1. Set OPENAI_API_KEY for Mem0")
-    print("  2. Run 'letta server' for Letta web UI")
-    print("  3. Set up Zep Cloud or self-hosted server")
-    print("  4. Wire these into your OpenClaw agent")
+    print("""
+💡 Next steps:
+  1. Set OPENAI_API_KEY for Mem0
+  2. Run 'letta server' for Letta web UI
+  3. Set up Zep Cloud or self-hosted server
+  4. Wire these into your OpenClaw agent""")
 
 if __name__ == "__main__":
     main()
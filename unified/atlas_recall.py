@@ -17,11 +17,16 @@ Searches:
 """
 
 import os
+import re
 import sys
 import json
 import argparse
+import asyncio
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -32,6 +37,36 @@ MEMORY_FILE = CLAWD_DIR / "MEMORY.md"
 CHROMA_DIR = Path.home() / ".atlas" / "chroma"
 INDEX_STATE = Path.home() / ".atlas" / "index_state.json"
 
+# Max documents per ChromaDB add() call
+CHROMA_BATCH_SIZE = 250
+
+# Max concurrent archival POSTs to Letta while indexing
+LETTA_MAX_CONCURRENCY = 8
+
+# Fast change-detection hash if blake3 is installed, md5 otherwise
+try:
+    from blake3 import blake3 as _file_hasher
+except ImportError:
+    _file_hasher = hashlib.md5
+
+# Faster index state (de)serialization if orjson is installed
+try:
+    import orjson
+    
+    def _loads(data: str):
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# Markdown header line: leading #'s, then the header text
+_HEADER_RE = re.compile(r'^(#+)\s*(.*)$')
+
 # Ensure directories exist
 CHROMA_DIR.mkdir(parents=True, exist_ok=True)
 INDEX_STATE.parent.mkdir(parents=True, exist_ok=True)
@@ -55,76 +90,90 @@ def chunk_markdown(content: str, chunk_size: int = 1000, overlap: int = 100) ->
     """
     Split markdown into semantic chunks based on headers and size.
     Returns list of {text, metadata} dicts.
+    
+    Chunks are tracked as line-index ranges into `content` and sliced out
+    once when emitted, so no per-line strings are rejoined.
     """
     chunks = []
-    lines = content.split('\n')
+    lines = content.splitlines(keepends=True)
     
-    current_chunk = []
+    # Offset of the first character of each line, plus an end sentinel.
+    # Lines keep their newlines, so sizes are exact serialized lengths.
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+    n_lines = len(lines)
+    
+    def span_size(start: int, end: int) -> int:
+        """Characters in lines [start, end)."""
+        return line_starts[end] - line_starts[start]
+    
+    # Lines carried over from the end of one chunk into the next
+    overlap_lines = 3
+    
+    chunk_start = 0
     current_headers = []
     current_size = 0
     
-    for line in lines:
+    def flush(end: int):
+        """Emit lines [chunk_start, end) and keep the last few as overlap."""
+        nonlocal chunk_start, current_size
+        chunks.append({
+            'text': content[line_starts[chunk_start]:line_starts[end]],
+            'headers': ' > '.join(current_headers),
+            'size': current_size
+        })
+        chunk_start = max(chunk_start, end - overlap_lines)
+        current_size = span_size(chunk_start, end)
+    
+    for idx, line in enumerate(lines):
         # Track headers for context
-        if line.startswith('#'):
-            level = len(line) - len(line.lstrip('#'))
-            header_text = line.lstrip('#').strip()
+        if line[:1] == '#':
+            m = _HEADER_RE.match(line)
+            level = len(m.group(1))
+            header_text = m.group(2).strip()
             
             # Flush current chunk if it's substantial
             if current_size > 200:
-                chunks.append({
-                    'text': '\n'.join(current_chunk),
-                    'headers': ' > '.join(current_headers),
-                    'size': current_size
-                })
-                # Keep overlap
-                overlap_lines = current_chunk[-3:] if len(current_chunk) > 3 else current_chunk
-                current_chunk = overlap_lines
-                current_size = sum(len(l) for l in current_chunk)
+                flush(idx)
             
             # Update header stack
-            current_headers = current_headers[:level-1] + [header_text]
+            del current_headers[level-1:]
+            current_headers.append(header_text)
         
-        current_chunk.append(line)
         current_size += len(line)
         
         # Flush if chunk is large enough
         if current_size >= chunk_size:
-            chunks.append({
-                'text': '\n'.join(current_chunk),
-                'headers': ' > '.join(current_headers),
-                'size': current_size
-            })
-            # Keep overlap
-            overlap_lines = current_chunk[-3:] if len(current_chunk) > 3 else current_chunk
-            current_chunk = overlap_lines
-            current_size = sum(len(l) for l in current_chunk)
+            flush(idx + 1)
     
     # Final chunk
-    if current_chunk:
-        chunks.append({
-            'text': '\n'.join(current_chunk),
-            'headers': ' > '.join(current_headers),
-            'size': current_size
-        })
+    if chunk_start < n_lines:
+        flush(n_lines)
     
     return chunks
 
 
+def _hash_bytes(data: bytes) -> str:
+    """Hash already-read file contents for change detection"""
+    return _file_hasher(data).hexdigest()
+
+
 def get_file_hash(path: Path) -> str:
     """Get hash of file contents for change detection"""
-    return hashlib.md5(path.read_bytes()).hexdigest()
+    return _hash_bytes(path.read_bytes())
 
 
 def load_index_state() -> Dict:
     """Load index state (tracks what's been indexed)"""
     if INDEX_STATE.exists():
-        return json.loads(INDEX_STATE.read_text())
+        return _loads(INDEX_STATE.read_text())
     return {"files": {}, "last_full_index": None}
 
 
 def save_index_state(state: Dict):
     """Save index state"""
-    INDEX_STATE.write_text(json.dumps(state, indent=2))
+    INDEX_STATE.write_text(_dumps(state))
 
 
 class AtlasRecall:
@@ -134,20 +183,35 @@ class AtlasRecall:
         self.quiet = quiet
         load_openai_key()
         
-        if not quiet:
-            print("🧠 Initializing Atlas Memory Stack...")
+        # Index state is read once and flushed by the indexing entry points
+        self._state = load_index_state()
         
-        # Initialize ChromaDB first (shared client)
-        import chromadb
-        self.chroma_client = chromadb.PersistentClient(path=str(CHROMA_DIR))
+        # Backends connect on first use (see the properties below),
+        # so commands like --add only pay for the backends they touch
+        self.user_id = "atlas"
+        self.letta_agent_id = None
+        self._letta_status = None
         
-        # Document storage collection
-        self.chroma = self.chroma_client.get_or_create_collection(
+        if not quiet:
+            print("🧠 Atlas Memory Stack (backends connect on first use)")
+    
+    @cached_property
+    def chroma_client(self):
+        """Shared ChromaDB client"""
+        import chromadb
+        return chromadb.PersistentClient(path=str(CHROMA_DIR))
+    
+    @cached_property
+    def chroma(self):
+        """Document storage collection"""
+        return self.chroma_client.get_or_create_collection(
             name="atlas_memory",
             metadata={"description": "Atlas agent memory files"}
         )
-        
-        # Mem0 - uses separate ChromaDB path to avoid conflicts
+    
+    @cached_property
+    def mem0(self):
+        """Mem0 - uses separate ChromaDB path to avoid conflicts"""
         from mem0 import Memory
         mem0_dir = CHROMA_DIR.parent / "mem0_chroma"
         mem0_dir.mkdir(parents=True, exist_ok=True)
@@ -160,33 +224,43 @@ class AtlasRecall:
                 }
             }
         }
-        self.mem0 = Memory.from_config(mem0_config)
-        self.user_id = "atlas"
-        
-        # Letta (optional)
-        self.letta = None
-        self.letta_agent_id = None
+        return Memory.from_config(mem0_config)
+    
+    @cached_property
+    def letta(self):
+        """
+        Letta client if the server is running (optional), else None.
+        The outcome is reported by connect_letta(), not printed here.
+        """
         try:
             import httpx
-            self.letta_client = httpx.Client(base_url="http://localhost:8283", timeout=10.0, follow_redirects=True)
+            client = httpx.Client(base_url="http://localhost:8283", timeout=10.0, follow_redirects=True)
             # Check if Letta is running
-            resp = self.letta_client.get("/v1/health/")
+            resp = client.get("/v1/health/")
             if resp.status_code == 200:
-                self.letta = self.letta_client
-                self._ensure_letta_agent()
-                if not quiet:
-                    print("  ✅ Letta connected")
+                self._ensure_letta_agent(client)
+                self._letta_status = "  ✅ Letta connected"
+                return client
+            self._letta_status = f"  ⚠️ Letta not available: health check returned {resp.status_code}"
         except Exception as e:
-            if not quiet:
-                print(f"  ⚠️ Letta not available: {e}")
-        
-        if not quiet:
-            print("  ✅ Ready!")
+            self._letta_status = f"  ⚠️ Letta not available: {e}"
+        return None
     
-    def _ensure_letta_agent(self):
+    def connect_letta(self):
+        """
+        Probe Letta and print its status once. Commands call this before
+        printing anything else so the status line never lands mid-output.
+        """
+        letta = self.letta
+        if self._letta_status and not self.quiet:
+            print(self._letta_status)
+        self._letta_status = None
+        return letta
+    
+    def _ensure_letta_agent(self, client):
         """Create or get the Atlas agent in Letta"""
         try:
-            resp = self.letta.get("/v1/agents")
+            resp = client.get("/v1/agents")
             if resp.status_code == 200:
                 for agent in resp.json():
                     if agent.get("name") == "atlas":
@@ -202,98 +276,285 @@ class AtlasRecall:
                     {"label": "persona", "value": "I am Atlas, running on Clawdbot/OpenClaw."}
                 ]
             }
-            resp = self.letta.post("/v1/agents", json=payload)
+            resp = client.post("/v1/agents", json=payload)
             if resp.status_code in [200, 201]:
                 self.letta_agent_id = resp.json()["id"]
         except Exception:
             pass
     
-    def index_file(self, path: Path, force: bool = False) -> int:
-        """Index a single file into ChromaDB + Letta"""
+    def _prepare_file_chunks(self, path: Path, force: bool = False) -> Optional[Dict]:
+        """
+        Read and chunk a file for indexing.
+        Returns None if the file is missing or unchanged since the last index.
+        """
         if not path.exists():
-            return 0
+            return None
         
-        state = load_index_state()
-        file_hash = get_file_hash(path)
-        file_key = str(path)
+        # Read once: hash the bytes, then decode the same buffer
+        raw = path.read_bytes()
+        file_hash = _hash_bytes(raw)
         
         # Skip if unchanged
-        if not force and state["files"].get(file_key) == file_hash:
-            return 0
+        if not force and self._state["files"].get(str(path)) == file_hash:
+            return None
         
-        content = path.read_text()
+        content = raw.decode("utf-8")
+        if "\r" in content:
+            # Match read_text()'s universal newline handling
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         chunks = chunk_markdown(content)
         
-        # Delete old chunks for this file
+        now = datetime.now()
+        now_ts = now.timestamp()
+        now_iso = now.isoformat()
+        
+        docs, ids, metas = [], [], []
+        for i, chunk in enumerate(chunks):
+            docs.append(chunk["text"])
+            ids.append(f"{path.stem}_{i}_{now_ts}")
+            metas.append({
+                "source_file": str(path),
+                "headers": chunk["headers"],
+                "chunk_index": i,
+                "indexed_at": now_iso
+            })
+        
+        return {
+            "path": path,
+            "hash": file_hash,
+            "content": content,
+            "docs": docs,
+            "ids": ids,
+            "metas": metas
+        }
+    
+    def _store_prepared(self, prepared: List[Dict]) -> List[str]:
+        """
+        Replace the ChromaDB chunks of every prepared file in one pass and
+        record the new hashes in the cached state (the caller saves it).
+        Letta is optional: archival failures are returned as error strings
+        but do not keep a file from being marked as indexed.
+        """
+        if not prepared:
+            return []
+        
+        # Delete old chunks for these files
+        source_files = [str(item["path"]) for item in prepared]
+        if len(source_files) == 1:
+            where = {"source_file": source_files[0]}
+        else:
+            where = {"source_file": {"$in": source_files}}
         try:
-            existing = self.chroma.get(where={"source_file": str(path)})
-            if existing["ids"]:
-                self.chroma.delete(ids=existing["ids"])
+            self.chroma.delete(where=where)
         except Exception:
             pass
         
         # Add new chunks to ChromaDB
-        for i, chunk in enumerate(chunks):
-            doc_id = f"{path.stem}_{i}_{datetime.now().timestamp()}"
-            self.chroma.add(
-                documents=[chunk["text"]],
-                ids=[doc_id],
-                metadatas=[{
-                    "source_file": str(path),
-                    "headers": chunk["headers"],
-                    "chunk_index": i,
-                    "indexed_at": datetime.now().isoformat()
-                }]
-            )
+        self._add_chunks(
+            [doc for item in prepared for doc in item["docs"]],
+            [doc_id for item in prepared for doc_id in item["ids"]],
+            [meta for item in prepared for meta in item["metas"]]
+        )
+        
+        # ChromaDB has the new chunks, so the files count as indexed
+        for item in prepared:
+            self._state["files"][str(item["path"])] = item["hash"]
         
-        # Also add to Letta archival if available
+        # Also add a summary of each file to Letta archival if available
+        failed = {}
         if self.letta and self.letta_agent_id:
             try:
-                # Store summary in archival
-                summary = f"File: {path.name}\n\n" + content[:2000]
-                self.letta.post(
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    failed = asyncio.run(self._archive_in_letta(prepared))
+                else:
+                    # Called from async code, where asyncio.run() can't nest
+                    failed = self._archive_in_letta_sync(prepared)
+            except Exception as e:
+                failed = {item["path"]: e for item in prepared}
+        
+        return [f"{path.name}: Letta archival failed: {e}" for path, e in failed.items()]
+    
+    def _letta_summary(self, item: Dict) -> str:
+        """Archival text stored in Letta for an indexed file"""
+        return f"File: {item['path'].name}\n\n" + item["content"][:2000]
+    
+    def _archive_in_letta_sync(self, prepared: List[Dict]) -> Dict[Path, Exception]:
+        """POST archival summaries one at a time with the sync client"""
+        failed = {}
+        for item in prepared:
+            try:
+                resp = self.letta.post(
                     f"/v1/agents/{self.letta_agent_id}/archival",
-                    json={"text": summary}
+                    json={"text": self._letta_summary(item)}
                 )
-            except Exception:
-                pass
+                resp.raise_for_status()
+            except Exception as e:
+                failed[item["path"]] = e
+        return failed
+    
+    async def _archive_in_letta(self, prepared: List[Dict]) -> Dict[Path, Exception]:
+        """
+        POST a summary of each file to Letta archival, at most
+        LETTA_MAX_CONCURRENCY at a time. Returns {path: error} for failures.
+        """
+        import httpx
+        limit = asyncio.Semaphore(LETTA_MAX_CONCURRENCY)
         
-        # Update state
-        state["files"][file_key] = file_hash
-        save_index_state(state)
+        async def archive(client, item: Dict):
+            async with limit:
+                resp = await client.post(
+                    f"/v1/agents/{self.letta_agent_id}/archival",
+                    json={"text": self._letta_summary(item)}
+                )
+                resp.raise_for_status()
+        
+        async with httpx.AsyncClient(
+            base_url=str(self.letta.base_url), timeout=10.0, follow_redirects=True
+        ) as client:
+            outcomes = await asyncio.gather(
+                *(archive(client, item) for item in prepared),
+                return_exceptions=True
+            )
         
-        return len(chunks)
+        return {
+            item["path"]: outcome
+            for item, outcome in zip(prepared, outcomes)
+            if isinstance(outcome, Exception)
+        }
+    
+    def index_file(self, path: Path, force: bool = False) -> int:
+        """Index a single file into ChromaDB + Letta"""
+        self.connect_letta()
+        prepared = self._prepare_file_chunks(path, force)
+        if prepared is None:
+            return 0
+        
+        for error in self._store_prepared([prepared]):
+            if not self.quiet:
+                print(f"  ⚠️ {error}")
+        save_index_state(self._state)
+        
+        return len(prepared["docs"])
+    
+    def _add_chunks(self, docs: List[str], ids: List[str], metas: List[Dict]):
+        """Add chunks to ChromaDB in batches of CHROMA_BATCH_SIZE"""
+        for start in range(0, len(docs), CHROMA_BATCH_SIZE):
+            end = start + CHROMA_BATCH_SIZE
+            self.chroma.add(
+                documents=docs[start:end],
+                ids=ids[start:end],
+                metadatas=metas[start:end]
+            )
+    
+    def _sqlite_conn_pool(self):
+        """ChromaDB's SQLite connection pool (private API, may change)"""
+        # Current clients keep the SysDB on the server (SegmentAPI);
+        # clients from before the Client/AdminClient split held it directly
+        server = getattr(self.chroma_client, "_server", self.chroma_client)
+        return server._sysdb._conn_pool
     
-    def index_all(self, force: bool = False) -> Dict:
-        """Index all memory files"""
+    @contextmanager
+    def _tune_sqlite_for_bulk(self):
+        """
+        Relax ChromaDB's SQLite durability settings for a bulk write and
+        restore them afterwards. Not crash-safe: a crash mid-index can
+        corrupt the store, so this is only used with --unsafe-bulk.
+        
+        Persistent clients pool one connection per thread, so the writes
+        must run on the calling thread to see these settings.
+        """
+        pragmas = {
+            "journal_mode": "MEMORY",
+            "synchronous": "OFF",
+            "temp_store": "MEMORY",
+            "locking_mode": "EXCLUSIVE"
+        }
+        # What each PRAGMA reads back as once applied
+        applied = {
+            "journal_mode": "memory",
+            "synchronous": 0,
+            "temp_store": 2,
+            "locking_mode": "exclusive"
+        }
+        conn = None
+        original = {}
+        try:
+            conn = self._sqlite_conn_pool().connect()
+            for name, value in pragmas.items():
+                original[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+                conn.execute(f"PRAGMA {name}={value}")
+            ignored = [
+                name for name, value in applied.items()
+                if conn.execute(f"PRAGMA {name}").fetchone()[0] != value
+            ]
+            if ignored and not self.quiet:
+                print(f"  ⚠️ SQLite ignored bulk PRAGMAs: {', '.join(ignored)}")
+        except Exception as e:
+            # Not a SQLite-backed client (or internals changed): write normally
+            if not self.quiet:
+                print(f"  ⚠️ Bulk SQLite tuning unavailable: {e}")
+        
+        try:
+            yield
+        finally:
+            if conn is not None:
+                for name, value in original.items():
+                    try:
+                        conn.execute(f"PRAGMA {name}={value}")
+                    except Exception:
+                        pass
+    
+    def index_all(self, force: bool = False, unsafe_bulk: bool = False) -> Dict:
+        """
+        Index all memory files.
+        Changed files are chunked first, then written to ChromaDB together
+        and the index state is saved once.
+        """
+        self.connect_letta()
         results = {"files": 0, "chunks": 0, "errors": []}
         
-        # Index MEMORY.md
-        if MEMORY_FILE.exists():
+        # MEMORY.md, then memory/*.md
+        paths = [MEMORY_FILE] if MEMORY_FILE.exists() else []
+        if MEMORY_DIR.exists():
+            paths += sorted(MEMORY_DIR.glob("*.md"))
+        
+        def prepare(path: Path):
             try:
-                chunks = self.index_file(MEMORY_FILE, force)
-                results["files"] += 1
-                results["chunks"] += chunks
-                print(f"  📄 MEMORY.md: {chunks} chunks")
+                return self._prepare_file_chunks(path, force), None
             except Exception as e:
-                results["errors"].append(f"MEMORY.md: {e}")
+                return None, e
         
-        # Index memory/*.md
-        if MEMORY_DIR.exists():
-            for md_file in sorted(MEMORY_DIR.glob("*.md")):
-                try:
-                    chunks = self.index_file(md_file, force)
-                    if chunks > 0:
-                        results["files"] += 1
-                        results["chunks"] += chunks
-                        print(f"  📄 {md_file.name}: {chunks} chunks")
-                except Exception as e:
-                    results["errors"].append(f"{md_file.name}: {e}")
+        # Hashing and reading are I/O bound, so fan them out across files
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            outcomes = list(pool.map(prepare, paths))
+        
+        prepared = []
+        for path, (item, error) in zip(paths, outcomes):
+            if error is not None:
+                results["errors"].append(f"{path.name}: {error}")
+            elif item is not None:
+                prepared.append(item)
+        
+        try:
+            if unsafe_bulk and prepared:
+                with self._tune_sqlite_for_bulk():
+                    results["errors"] += self._store_prepared(prepared)
+            else:
+                results["errors"] += self._store_prepared(prepared)
+        except Exception as e:
+            results["errors"].append(f"ChromaDB: {e}")
+            return results
+        
+        for item in prepared:
+            results["files"] += 1
+            results["chunks"] += len(item["docs"])
+            print(f"  📄 {item['path'].name}: {len(item['docs'])} chunks")
         
         # Update last full index time
-        state = load_index_state()
-        state["last_full_index"] = datetime.now().isoformat()
-        save_index_state(state)
+        self._state["last_full_index"] = datetime.now().isoformat()
+        save_index_state(self._state)
         
         return results
     
@@ -302,10 +563,61 @@ class AtlasRecall:
         result = self.mem0.add(text, user_id=self.user_id)
         return {"source": "mem0", "result": result}
     
+    def _query_mem0(self, query: str, limit: int) -> List[Dict]:
+        """Search Mem0 facts"""
+        mem0_raw = self.mem0.search(query, user_id=self.user_id, limit=limit)
+        # Mem0 returns {'results': [...]}
+        mem0_list = mem0_raw.get("results", []) if isinstance(mem0_raw, dict) else mem0_raw
+        return [
+            {
+                "text": r.get("memory", r.get("text", str(r))),
+                "score": r.get("score", 0),
+                "source": "mem0"
+            }
+            for r in mem0_list
+        ]
+    
+    def _query_chroma(self, query: str, limit: int) -> List[Dict]:
+        """Search ChromaDB document chunks"""
+        chroma_results = self.chroma.query(
+            query_texts=[query],
+            n_results=limit
+        )
+        
+        hits = []
+        for i, doc in enumerate(chroma_results["documents"][0]):
+            meta = chroma_results["metadatas"][0][i]
+            dist = chroma_results["distances"][0][i] if chroma_results.get("distances") else 0
+            source_file = meta.get("source_file", "unknown")
+            hits.append({
+                "text": doc,
+                "file": source_file,
+                "file_name": os.path.basename(source_file),
+                "headers": meta.get("headers", ""),
+                "distance": dist,
+                "source": "chroma"
+            })
+        return hits
+    
+    def _query_letta(self, query: str, limit: int) -> List[Dict]:
+        """Search Letta archival memory"""
+        resp = self.letta.get(
+            f"/v1/agents/{self.letta_agent_id}/archival",
+            params={"query": query, "limit": limit}
+        )
+        if resp.status_code != 200:
+            return []
+        return [
+            {"text": item.get("text", ""), "source": "letta"}
+            for item in resp.json()
+        ]
+    
     def recall(self, query: str, limit: int = 5) -> Dict:
         """
         Search all memory systems and return unified results.
+        The backends are independent, so they are queried concurrently.
         """
+        self.connect_letta()
         results = {
             "query": query,
             "timestamp": datetime.now().isoformat(),
@@ -314,57 +626,31 @@ class AtlasRecall:
             "letta": []
         }
         
-        # Mem0 search
-        try:
-            mem0_raw = self.mem0.search(query, user_id=self.user_id, limit=limit)
-            # Mem0 returns {'results': [...]}
-            mem0_list = mem0_raw.get("results", []) if isinstance(mem0_raw, dict) else mem0_raw
-            results["mem0"] = [
-                {
-                    "text": r.get("memory", r.get("text", str(r))),
-                    "score": r.get("score", 0),
-                    "source": "mem0"
-                }
-                for r in mem0_list
-            ]
-        except Exception as e:
-            results["mem0_error"] = str(e)
-        
-        # ChromaDB search
-        try:
-            chroma_results = self.chroma.query(
-                query_texts=[query],
-                n_results=limit
-            )
-            
-            for i, doc in enumerate(chroma_results["documents"][0]):
-                meta = chroma_results["metadatas"][0][i]
-                dist = chroma_results["distances"][0][i] if chroma_results.get("distances") else 0
-                results["chroma"].append({
-                    "text": doc,
-                    "file": meta.get("source_file", "unknown"),
-                    "headers": meta.get("headers", ""),
-                    "distance": dist,
-                    "source": "chroma"
-                })
-        except Exception as e:
-            results["chroma_error"] = str(e)
-        
-        # Letta archival search
-        if self.letta and self.letta_agent_id:
+        # Connect backends here rather than in the workers, so Mem0 and
+        # ChromaDB don't import and build their clients concurrently
+        backends = {}
+        for name, search in (("mem0", self._query_mem0), ("chroma", self._query_chroma)):
             try:
-                resp = self.letta.get(
-                    f"/v1/agents/{self.letta_agent_id}/archival",
-                    params={"query": query, "limit": limit}
-                )
-                if resp.status_code == 200:
-                    for item in resp.json():
-                        results["letta"].append({
-                            "text": item.get("text", ""),
-                            "source": "letta"
-                        })
+                getattr(self, name)
+                backends[name] = search
             except Exception as e:
-                results["letta_error"] = str(e)
+                results[f"{name}_error"] = str(e)
+        if self.letta and self.letta_agent_id:
+            backends["letta"] = self._query_letta
+        
+        if not backends:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(backends)) as pool:
+            futures = {
+                name: pool.submit(search, query, limit)
+                for name, search in backends.items()
+            }
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[f"{name}_error"] = str(e)
         
         return results
     
@@ -388,39 +674,51 @@ class AtlasRecall:
             # Convert distance to score (lower distance = higher score)
             score = 1 - min(item.get("distance", 0.5), 1)
             all_results.append({
-                "text": item["text"][:500],
-                "source": f"chroma:{Path(item.get('file', '')).name}",
+                "text": item["text"],
+                "source": f"chroma:{item.get('file_name', '')}",
                 "headers": item.get("headers", ""),
                 "score": score
             })
         
         for item in raw.get("letta", []):
             all_results.append({
-                "text": item["text"][:500],
+                "text": item["text"],
                 "source": "letta",
                 "score": 0.7  # Letta results are pre-filtered
             })
         
-        # Sort by score and dedupe
+        # Sort by score (stable, highest first) and dedupe
+        import numpy as np
+        scores = np.fromiter(
+            (item.get("score", 0) for item in all_results),
+            dtype=np.float64,
+            count=len(all_results)
+        )
+        order = np.argsort(-scores, kind="stable")
+        
         seen = set()
         unique = []
-        for item in sorted(all_results, key=lambda x: x.get("score", 0), reverse=True):
-            text_hash = hashlib.md5(item["text"][:100].encode()).hexdigest()
-            if text_hash not in seen:
-                seen.add(text_hash)
+        for idx in order:
+            item = all_results[idx]
+            key = item["text"][:100]
+            if key not in seen:
+                seen.add(key)
                 unique.append(item)
+                if len(unique) >= limit:
+                    break
         
         return unique[:limit]
     
     def stats(self) -> Dict:
         """Get memory system statistics"""
+        self.connect_letta()
         mem0_all = self.mem0.get_all(user_id=self.user_id)
         mem0_count = len(mem0_all.get("results", [])) if isinstance(mem0_all, dict) else len(mem0_all)
         stats = {
             "chroma_docs": self.chroma.count(),
             "mem0_memories": mem0_count,
             "letta_available": self.letta is not None,
-            "index_state": load_index_state()
+            "index_state": self._state
         }
         
         if self.letta and self.letta_agent_id:
@@ -439,6 +737,8 @@ def main():
     parser.add_argument("query", nargs="*", help="Search query")
     parser.add_argument("--index", action="store_true", help="Index all memory files")
     parser.add_argument("--force", action="store_true", help="Force re-index even if unchanged")
+    parser.add_argument("--unsafe-bulk", action="store_true",
+                        help="Faster --index with SQLite durability off (not crash-safe)")
     parser.add_argument("--stats", action="store_true", help="Show memory stats")
     parser.add_argument("--add", type=str, help="Add a fact to memory")
     parser.add_argument("--limit", type=int, default=5, help="Number of results")
@@ -449,15 +749,18 @@ def main():
     
     recall = AtlasRecall(quiet=args.quiet or args.json)
     
+    # Commands that use Letta report its status up front, before their output
     if args.index:
+        recall.connect_letta()
         print("\n📚 Indexing all memory files...")
-        results = recall.index_all(force=args.force)
+        results = recall.index_all(force=args.force, unsafe_bulk=args.unsafe_bulk)
         print(f"\n✅ Indexed {results['files']} files, {results['chunks']} chunks")
         if results["errors"]:
             print(f"⚠️ Errors: {results['errors']}")
         return
     
     if args.stats:
+        recall.connect_letta()
         stats = recall.stats()
         if args.json:
             print(json.dumps(stats, indent=2, default=str))
@@ -480,6 +783,7 @@ def main():
         return
     
     query = " ".join(args.query)
+    recall.connect_letta()
     
     if args.json:
         results = recall.recall(query, limit=args.limit)